@@ -12,6 +12,7 @@ def deserialize(device_description):
     dev_desc = json.dumps(device_description)
     device_obj.hash_string = hash_string_from_string(dev_desc)
     device_obj.hash_uint32 = hash_int_from_string(dev_desc)
+    device_obj.spec_digest = hashlib.sha256(dev_desc.encode()).hexdigest()
     return device_obj
 
 
@@ -4,10 +4,17 @@ Code formatting utilities for generated code.
 
 import shutil
 import subprocess
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def is_clang_format_available() -> bool:
-    """Check if clang-format is installed on the system."""
+    """
+    Check if clang-format is installed on the system.
+
+    The PATH lookup runs once per process; format_c_code() is called for every
+    generated file and would otherwise repeat it each time.
+    """
     return shutil.which("clang-format") is not None
 
 
@@ -1,6 +1,7 @@
 import os
 from copy import copy
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from avlos.datatypes import DataType
 
@@ -21,12 +22,83 @@ _AVLOS_DTYPE_MAP = {
     DataType.STR: "AVLOS_DTYPE_STRING",
 }
 
+# _AVLOS_DTYPE_MAP flattened into a tuple indexed by DataType value (values are
+# contiguous from 0); avoids hashing the enum member on every lookup.
+_DTYPE_TABLE = tuple(
+    _AVLOS_DTYPE_MAP.get(DataType(i), "AVLOS_DTYPE_UINT32") for i in range(max(d.value for d in DataType) + 1)
+)
+
+# Size of Avlos_EndpointMeta.arg_dtypes in avlos_endpoint_metadata.h.jinja
+AVLOS_MAX_CALL_ARGS = 4
+
+# Avlos_EndpointKind names for non-callable endpoints, indexed by
+# (has_setter << 1) | has_getter. An endpoint with neither falls back to READ_ONLY.
+_EP_KIND_TABLE = (
+    "AVLOS_EP_KIND_READ_ONLY",
+    "AVLOS_EP_KIND_READ_ONLY",
+    "AVLOS_EP_KIND_WRITE_ONLY",
+    "AVLOS_EP_KIND_READ_WRITE",
+)
+
+
+# Single-slot cache for _collect(): (root, (endpoints, enum_eps, bitmask_eps)).
+# Holding a reference to the root keeps its identity valid while cached.
+_collect_cache = (None, None)
+
+
+def _collect(input) -> Tuple[List, List, List]:
+    """
+    Traverse remote dictionary once and classify its endpoints.
+
+    Templates apply the endpoints, enum_eps and bitmask_eps filters to the same
+    root several times per render, so the result for the most recent root is
+    cached. Device trees are not mutated after deserialization, and callers
+    must not mutate the returned lists.
+
+    Args:
+        input: Root RemoteNode to traverse
+
+    Returns:
+        Tuple of (all endpoints, enum endpoints, bitmask endpoints)
+    """
+    global _collect_cache
+    cached_input, cached_result = _collect_cache
+    if cached_input is input:
+        return cached_result
+
+    ep_out_list: List = []
+    enum_out_list: List = []
+    bitmask_out_list: List = []
+
+    # Iterative depth-first walk. Children are pushed in reverse so they are
+    # popped in declaration order, preserving the canonical endpoint order.
+    stack: List = []
+    if hasattr(input, "remote_attributes"):
+        stack.extend(reversed(input.remote_attributes.values()))
+    while stack:
+        ep = stack.pop()
+        # Probe the instance dict directly: hasattr() on a RemoteNode falls
+        # through its __getattr__ and raises/catches AttributeError per miss.
+        d = ep.__dict__
+        if "getter_name" in d or "setter_name" in d or "caller_name" in d:
+            ep_out_list.append(ep)
+            if "options" in d:
+                enum_out_list.append(ep)
+            elif "bitmask" in d:
+                bitmask_out_list.append(ep)
+        elif "remote_attributes" in d:
+            stack.extend(reversed(d["remote_attributes"].values()))
+
+    result = (ep_out_list, enum_out_list, bitmask_out_list)
+    _collect_cache = (input, result)
+    return result
+
 
 def avlos_endpoints(input) -> List:
     """
     Traverse remote dictionary and return list of remote endpoints.
 
-    Recursively walks the tree of RemoteNode objects and collects all endpoint
+    Walks the tree of RemoteNode objects depth-first and collects all endpoint
     objects (those with getter_name, setter_name, or caller_name).
 
     Args:
@@ -35,19 +107,7 @@ def avlos_endpoints(input) -> List:
     Returns:
         Flat list of all endpoint objects found in the tree
     """
-
-    def traverse_endpoint_list(ep_list, ep_out_list: List) -> None:
-        """Helper function to recursively traverse endpoint tree."""
-        for ep in ep_list:
-            if hasattr(ep, "getter_name") or hasattr(ep, "setter_name") or hasattr(ep, "caller_name"):
-                ep_out_list.append(ep)
-            elif hasattr(ep, "remote_attributes"):
-                traverse_endpoint_list(ep.remote_attributes.values(), ep_out_list)
-
-    ep_out_list: List = []
-    if hasattr(input, "remote_attributes"):
-        traverse_endpoint_list(input.remote_attributes.values(), ep_out_list)
-    return ep_out_list
+    return _collect(input)[0]
 
 
 def avlos_enum_eps(input) -> List:
@@ -60,7 +120,7 @@ def avlos_enum_eps(input) -> List:
     Returns:
         List of RemoteEnum objects
     """
-    return [ep for ep in avlos_endpoints(input) if hasattr(ep, "options")]
+    return _collect(input)[1]
 
 
 def avlos_bitmask_eps(input) -> List:
@@ -73,7 +133,7 @@ def avlos_bitmask_eps(input) -> List:
     Returns:
         List of RemoteBitmask objects
     """
-    return [ep for ep in avlos_endpoints(input) if hasattr(ep, "bitmask")]
+    return _collect(input)[2]
 
 
 def as_include(input: str) -> str:
@@ -89,9 +149,10 @@ def as_include(input: str) -> str:
     Returns:
         Properly formatted include directive (e.g., "<stdio.h>" or '"myheader.h"')
     """
-    if input.startswith('"') and input.endswith('"'):
-        return input
-    elif input.startswith("<") and input.endswith(">"):
+    if not input:
+        return "<>"
+    first, last = input[0], input[-1]
+    if (first == '"' and last == '"') or (first == "<" and last == ">"):
         return input
     return "<" + input + ">"
 
@@ -109,6 +170,7 @@ def file_from_path(input: str) -> str:
     return os.path.basename(input)
 
 
+@lru_cache(maxsize=256)
 def capitalize_first(input: str) -> str:
     """
     Capitalize the first character of a string, leaving the rest unchanged.
@@ -119,7 +181,7 @@ def capitalize_first(input: str) -> str:
     Returns:
         String with first character capitalized
     """
-    return input[0].upper() + input[1:]
+    return f"{input[:1].upper()}{input[1:]}"
 
 
 def avlos_ep_kind(ep) -> str:
@@ -132,21 +194,12 @@ def avlos_ep_kind(ep) -> str:
     Returns:
         String like AVLOS_EP_KIND_READ_ONLY, AVLOS_EP_KIND_CALL_WITH_ARGS, etc.
     """
-    has_getter = getattr(ep, "getter_name", None) is not None
-    has_setter = getattr(ep, "setter_name", None) is not None
-    has_caller = getattr(ep, "caller_name", None) is not None
-    if has_caller:
-        num_args = len(getattr(ep, "arguments", None) or [])
-        if num_args == 0:
-            return "AVLOS_EP_KIND_CALL_NO_ARGS"
-        return "AVLOS_EP_KIND_CALL_WITH_ARGS"
-    if has_getter and has_setter:
-        return "AVLOS_EP_KIND_READ_WRITE"
-    if has_getter:
-        return "AVLOS_EP_KIND_READ_ONLY"
-    if has_setter:
-        return "AVLOS_EP_KIND_WRITE_ONLY"
-    return "AVLOS_EP_KIND_READ_ONLY"  # fallback
+    d = ep.__dict__
+    if d.get("caller_name") is not None:
+        if d.get("arguments"):
+            return "AVLOS_EP_KIND_CALL_WITH_ARGS"
+        return "AVLOS_EP_KIND_CALL_NO_ARGS"
+    return _EP_KIND_TABLE[(d.get("setter_name") is not None) << 1 | (d.get("getter_name") is not None)]
 
 
 def avlos_metadata_dtype(value) -> str:
@@ -163,7 +216,39 @@ def avlos_metadata_dtype(value) -> str:
         String like AVLOS_DTYPE_UINT32, AVLOS_DTYPE_FLOAT, etc.
     """
     dtype = getattr(value, "dtype", value)
-    try:
-        return _AVLOS_DTYPE_MAP[dtype]
-    except KeyError:
-        return "AVLOS_DTYPE_UINT32"  # safe fallback
+    if isinstance(dtype, DataType):
+        return _DTYPE_TABLE[dtype.value]
+    return "AVLOS_DTYPE_UINT32"  # safe fallback
+
+
+def avlos_precompute_meta(input) -> List[dict]:
+    """
+    Resolve the endpoint metadata table rows for a device in a single pass.
+
+    Each row carries the fields of one Avlos_EndpointMeta entry as ready-to-emit
+    strings, so the metadata template makes no filter calls per endpoint.
+
+    Args:
+        input: Root RemoteNode to traverse
+
+    Returns:
+        List of dicts with endpoint_function_name, ep_id, kind, value_dtype,
+        num_args and arg_dtypes (always AVLOS_MAX_CALL_ARGS entries, VOID-padded)
+    """
+    rows = []
+    for ep in avlos_endpoints(input):
+        kind = avlos_ep_kind(ep)
+        args = ep.arguments if kind == "AVLOS_EP_KIND_CALL_WITH_ARGS" else []
+        arg_dtypes = [avlos_metadata_dtype(arg) for arg in args[:AVLOS_MAX_CALL_ARGS]]
+        arg_dtypes += ["AVLOS_DTYPE_VOID"] * (AVLOS_MAX_CALL_ARGS - len(arg_dtypes))
+        rows.append(
+            {
+                "endpoint_function_name": ep.endpoint_function_name,
+                "ep_id": ep.ep_id,
+                "kind": kind,
+                "value_dtype": avlos_metadata_dtype(ep),
+                "num_args": len(args),
+                "arg_dtypes": arg_dtypes,
+            }
+        )
+    return rows
@@ -1,44 +1,135 @@
+import hashlib
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader, select_autoescape
 
+from avlos import __version__
 from avlos.formatting import format_c_code, is_clang_format_available
 from avlos.generators.filters import (
     as_include,
     avlos_bitmask_eps,
     avlos_endpoints,
     avlos_enum_eps,
-    avlos_ep_kind,
-    avlos_metadata_dtype,
+    avlos_precompute_meta,
 )
-from avlos.validation import ValidationError, validate_all
+from avlos.validation import ValidationError, validate_all_cached
 
-env = Environment(loader=PackageLoader("avlos"), autoescape=select_autoescape())
 
+def _make_bytecode_cache():
+    """Return a per-user on-disk bytecode cache, or None if no safe temp directory is usable."""
+    try:
+        return FileSystemBytecodeCache(pattern="__avlos_%s.cache")
+    except (OSError, RuntimeError):
+        return None
+
+
+env = Environment(
+    loader=PackageLoader("avlos"),
+    autoescape=select_autoescape(),
+    auto_reload=False,
+    optimized=True,
+    cache_size=-1,
+    bytecode_cache=_make_bytecode_cache(),
+)
+
+env.filters.update(
+    {
+        "endpoints": avlos_endpoints,
+        "enum_eps": avlos_enum_eps,
+        "bitmask_eps": avlos_bitmask_eps,
+        "as_include": as_include,
+        "meta_rows": avlos_precompute_meta,
+    }
+)
+
+_TPL_ENUMS = env.get_template("tm_enums.h.jinja")
+_TPL_FW_H = env.get_template("fw_endpoints.h.jinja")
+_TPL_FW_C = env.get_template("fw_endpoints.c.jinja")
+_TPL_META_H = env.get_template("avlos_endpoint_metadata.h.jinja")
+_TPL_META_C = env.get_template("avlos_endpoint_metadata.c.jinja")
 
-def _generate_metadata_if_requested(instance, config):
+# Digest of the template sources, part of every generation fingerprint
+_TEMPLATES_DIGEST = hashlib.blake2b(
+    "".join(
+        env.loader.get_source(env, t.name)[0] for t in (_TPL_ENUMS, _TPL_FW_H, _TPL_FW_C, _TPL_META_H, _TPL_META_C)
+    ).encode()
+).hexdigest()
+
+# First line of every generated file; marks the inputs it was generated from
+_GEN_HASH_PREFIX = "// avlos-gen-hash: "
+
+# Optional paths; metadata is generated only when both are present
+_METADATA_PATHS = ["output_metadata_header", "output_metadata_impl"]
+
+
+def _metadata_requested(paths):
+    """Return True when both endpoint metadata output paths are configured."""
+    return all(p in paths for p in _METADATA_PATHS)
+
+
+def _generation_hash(instance, config):
+    """
+    Fingerprint everything the generated files depend on: avlos version, template
+    sources, device spec, the config options that affect output and clang-format
+    availability. Output paths are left out so the fingerprint does not depend on
+    where the project is checked out.
+    Returns None when the instance carries no spec digest (not built by deserialize()).
+    """
+    spec_digest = getattr(instance, "spec_digest", None)
+    if spec_digest is None:
+        return None
+    paths = config["paths"]
+    output_config = {
+        "header_includes": config.get("header_includes", []),
+        "impl_includes": config.get("impl_includes", []),
+        "format_style": config.get("format_style", "LLVM"),
+        # The metadata impl includes its header by basename, so that is all that matters
+        "metadata_header": os.path.basename(paths["output_metadata_header"]) if _metadata_requested(paths) else None,
+    }
+    config_str = json.dumps(output_config, sort_keys=True, default=str)
+    h = hashlib.blake2b(digest_size=16)
+    for part in (__version__, _TEMPLATES_DIGEST, spec_digest, config_str, str(is_clang_format_available())):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _outputs_up_to_date(file_paths, gen_hash):
+    """Return True when every file exists and starts with the marker for gen_hash."""
+    # Compare bytes: an existing file need not be decodable to be overwritten
+    marker = (_GEN_HASH_PREFIX + gen_hash + "\n").encode()
+    for file_path in file_paths:
+        try:
+            with open(file_path, "rb") as f:
+                if f.readline() != marker:
+                    return False
+        except OSError:
+            return False
+    return True
+
+
+def _generate_metadata_if_requested(instance, config, gen_header=""):
     """Generate endpoint metadata .h/.c when both paths are in config. Returns extra paths or []."""
     paths = config["paths"]
-    if "output_metadata_header" not in paths or "output_metadata_impl" not in paths:
+    if not _metadata_requested(paths):
         return []
     meta_header_path = paths["output_metadata_header"]
     meta_impl_path = paths["output_metadata_impl"]
     metadata_header_basename = os.path.basename(meta_header_path)
-    os.makedirs(os.path.dirname(meta_header_path), exist_ok=True)
-    template_meta_h = env.get_template("avlos_endpoint_metadata.h.jinja")
     with open(meta_header_path, "w") as f:
-        print(template_meta_h.render(), file=f)
-    os.makedirs(os.path.dirname(meta_impl_path), exist_ok=True)
-    template_meta_c = env.get_template("avlos_endpoint_metadata.c.jinja")
+        f.write(gen_header)
+        _TPL_META_H.stream().dump(f)
+        f.write("\n")
     with open(meta_impl_path, "w") as f:
-        print(
-            template_meta_c.render(
-                instance=instance,
-                metadata_header_basename=metadata_header_basename,
-            ),
-            file=f,
-        )
+        f.write(gen_header)
+        _TPL_META_C.stream(
+            instance=instance,
+            metadata_header_basename=metadata_header_basename,
+        ).dump(f)
+        f.write("\n")
     return [meta_header_path, meta_impl_path]
 
 
@@ -51,7 +142,8 @@ def process(instance, config):
             "Please add a 'paths' section with: output_enums, output_header, output_impl"
         )
 
-    missing_paths = [p for p in required_paths if p not in config["paths"]]
+    paths = config["paths"]
+    missing_paths = [p for p in required_paths if p not in paths]
     if missing_paths:
         raise ValidationError(
             f"Config validation failed: Missing required paths in avlos config: {', '.join(missing_paths)}\n"
@@ -59,60 +151,58 @@ def process(instance, config):
         )
 
     # Validate before generation
-    validation_errors = validate_all(instance)
+    validation_errors = validate_all_cached(instance)
     if validation_errors:
         error_msg = "Validation failed:\n" + "\n".join(f"  - {err}" for err in validation_errors)
         raise ValidationError(error_msg)
 
-    env.filters["endpoints"] = avlos_endpoints
-    env.filters["enum_eps"] = avlos_enum_eps
-    env.filters["bitmask_eps"] = avlos_bitmask_eps
-    env.filters["as_include"] = as_include
-    env.filters["avlos_ep_kind"] = avlos_ep_kind
-    env.filters["avlos_metadata_dtype"] = avlos_metadata_dtype
-
-    template = env.get_template("tm_enums.h.jinja")
-    os.makedirs(os.path.dirname(config["paths"]["output_enums"]), exist_ok=True)
-    with open(config["paths"]["output_enums"], "w") as output_file:
-        print(
-            template.render(instance=instance),
-            file=output_file,
-        )
+    # Skip generation when all outputs were produced from identical inputs. A
+    # .clang-format file is not part of the fingerprint, so never skip with style "file".
+    output_keys = required_paths + _METADATA_PATHS if _metadata_requested(paths) else required_paths
+    gen_hash = _generation_hash(instance, config)
+    if (
+        gen_hash is not None
+        and config.get("format_style") != "file"
+        and _outputs_up_to_date([paths[p] for p in output_keys], gen_hash)
+    ):
+        return
+    gen_header = _GEN_HASH_PREFIX + gen_hash + "\n" if gen_hash is not None else ""
 
-    template = env.get_template("fw_endpoints.h.jinja")
-    try:
-        includes = config["header_includes"]
-    except KeyError:
-        includes = []
-    os.makedirs(os.path.dirname(config["paths"]["output_header"]), exist_ok=True)
-    with open(config["paths"]["output_header"], "w") as output_file:
-        print(
-            template.render(instance=instance, includes=includes),
-            file=output_file,
-        )
+    # Create each output directory once; outputs usually share a directory
+    for output_dir in {os.path.dirname(paths[p]) for p in output_keys}:
+        os.makedirs(output_dir, exist_ok=True)
 
-    template = env.get_template("fw_endpoints.c.jinja")
-    try:
-        includes = config["impl_includes"]
-    except KeyError:
-        includes = []
-    os.makedirs(os.path.dirname(config["paths"]["output_impl"]), exist_ok=True)
-    with open(config["paths"]["output_impl"], "w") as output_file:
-        print(
-            template.render(instance=instance, includes=includes),
-            file=output_file,
-        )
+    with open(paths["output_enums"], "w") as output_file:
+        output_file.write(gen_header)
+        _TPL_ENUMS.stream(instance=instance).dump(output_file)
+        output_file.write("\n")
+
+    includes = config.get("header_includes", [])
+    with open(paths["output_header"], "w") as output_file:
+        output_file.write(gen_header)
+        _TPL_FW_H.stream(instance=instance, includes=includes).dump(output_file)
+        output_file.write("\n")
+
+    includes = config.get("impl_includes", [])
+    with open(paths["output_impl"], "w") as output_file:
+        output_file.write(gen_header)
+        _TPL_FW_C.stream(instance=instance, includes=includes).dump(output_file)
+        output_file.write("\n")
 
     base_files = [
-        config["paths"]["output_enums"],
-        config["paths"]["output_header"],
-        config["paths"]["output_impl"],
+        paths["output_enums"],
+        paths["output_header"],
+        paths["output_impl"],
     ]
-    generated_files = base_files + _generate_metadata_if_requested(instance, config)
+    generated_files = base_files + _generate_metadata_if_requested(instance, config, gen_header)
 
-    # Post-process with clang-format if available
+    # Post-process with clang-format if available. Each file is formatted by a
+    # separate clang-format subprocess, so run them concurrently.
+    if not is_clang_format_available():
+        return
     format_style = config.get("format_style", "LLVM")
-    for file_path in generated_files:
-        success = format_c_code(file_path, format_style)
-        if not success and is_clang_format_available():
+    with ThreadPoolExecutor(max_workers=len(generated_files)) as executor:
+        results = list(executor.map(lambda file_path: format_c_code(file_path, format_style), generated_files))
+    for file_path, success in zip(generated_files, results):
+        if not success:
             print(f"Warning: clang-format failed for {file_path}", file=sys.stderr)
@@ -6,9 +6,24 @@ from jinja2 import Environment, PackageLoader, select_autoescape
 
 from avlos.formatting import format_c_code, is_clang_format_available
 from avlos.generators.filters import avlos_bitmask_eps, avlos_enum_eps, capitalize_first, file_from_path
-from avlos.validation import ValidationError, validate_all
-
-env = Environment(loader=PackageLoader("avlos"), autoescape=select_autoescape())
+from avlos.validation import ValidationError, validate_all_cached
+
+env = Environment(
+    loader=PackageLoader("avlos"),
+    autoescape=select_autoescape(),
+    auto_reload=False,
+    optimized=True,
+    cache_size=-1,
+)
+
+env.filters.update(
+    {
+        "enum_eps": avlos_enum_eps,
+        "bitmask_eps": avlos_bitmask_eps,
+        "file_from_path": file_from_path,
+        "capitalize_first": capitalize_first,
+    }
+)
 
 
 def process(instance, config):
@@ -28,15 +43,11 @@ def process(instance, config):
         )
 
     # Validate before generation
-    validation_errors = validate_all(instance)
+    validation_errors = validate_all_cached(instance)
     if validation_errors:
         error_msg = "Validation failed:\n" + "\n".join(f"  - {err}" for err in validation_errors)
         raise ValidationError(error_msg)
 
-    env.filters["enum_eps"] = avlos_enum_eps
-    env.filters["bitmask_eps"] = avlos_bitmask_eps
-    env.filters["file_from_path"] = file_from_path
-    env.filters["capitalize_first"] = capitalize_first
     process_helpers(instance, config)
     process_header(instance, config)
     process_impl(instance, config)
@@ -47,10 +58,8 @@ def process_helpers(instance, config):
     file_path = config["paths"]["output_helpers"]
     os.makedirs(os.path.dirname(config["paths"]["output_helpers"]), exist_ok=True)
     with open(file_path, "w") as output_file:
-        print(
-            template.render(instance=instance),
-            file=output_file,
-        )
+        template.stream(instance=instance).dump(output_file)
+        output_file.write("\n")
     # Format the generated file
     format_c_code(file_path, config.get("format_style", "LLVM"))
 
@@ -59,21 +68,16 @@ def process_header(instance, config):
     template = env.get_template("device.hpp.jinja")
     file_path = config["paths"]["output_header"]
     helper_file = config["paths"]["output_helpers"]
-    try:
-        includes = config["header_includes"]
-    except KeyError:
-        includes = []
+    includes = config.get("header_includes", [])
     os.makedirs(os.path.dirname(config["paths"]["output_header"]), exist_ok=True)
     with open(file_path, "w") as output_file:
-        print(
-            template.render(
-                instance=instance,
-                includes=includes,
-                helper_file=helper_file,
-                device_name=Path(config["paths"]["output_header"]).stem,
-            ),
-            file=output_file,
-        )
+        template.stream(
+            instance=instance,
+            includes=includes,
+            helper_file=helper_file,
+            device_name=Path(config["paths"]["output_header"]).stem,
+        ).dump(output_file)
+        output_file.write("\n")
     # Format the generated file
     format_c_code(file_path, config.get("format_style", "LLVM"))
 
@@ -91,10 +95,8 @@ def recurse_header(remote_object, config):
     helper_file = config["paths"]["output_helpers"]
     os.makedirs(os.path.dirname(config["paths"]["output_header"]), exist_ok=True)
     with open(file_path, "w") as output_file:
-        print(
-            template.render(instance=remote_object, helper_file=helper_file),
-            file=output_file,
-        )
+        template.stream(instance=remote_object, helper_file=helper_file).dump(output_file)
+        output_file.write("\n")
     # Format the generated file
     format_c_code(file_path, config.get("format_style", "LLVM"))
 
@@ -106,21 +108,16 @@ def recurse_header(remote_object, config):
 def process_impl(instance, config):
     template = env.get_template("device.cpp.jinja")
     file_path = config["paths"]["output_impl"]
-    try:
-        includes = config["impl_includes"]
-    except KeyError:
-        includes = []
+    includes = config.get("impl_includes", [])
     includes.append(Path(config["paths"]["output_header"]).name)
     os.makedirs(os.path.dirname(config["paths"]["output_impl"]), exist_ok=True)
     with open(file_path, "w") as output_file:
-        print(
-            template.render(
-                instance=instance,
-                includes=includes,
-                device_name=Path(config["paths"]["output_header"]).stem,
-            ),
-            file=output_file,
-        )
+        template.stream(
+            instance=instance,
+            includes=includes,
+            device_name=Path(config["paths"]["output_header"]).stem,
+        ).dump(output_file)
+        output_file.write("\n")
     # Format the generated file
     format_c_code(file_path, config.get("format_style", "LLVM"))
 
@@ -137,7 +134,8 @@ def recurse_impl(remote_object, config):
     )
     os.makedirs(os.path.dirname(config["paths"]["output_impl"]), exist_ok=True)
     with open(file_path, "w") as output_file:
-        print(template.render(instance=remote_object), file=output_file)
+        template.stream(instance=remote_object).dump(output_file)
+        output_file.write("\n")
     # Format the generated file
     format_c_code(file_path, config.get("format_style", "LLVM"))
 
@@ -4,16 +4,20 @@ from jinja2 import Environment, PackageLoader, select_autoescape
 
 from avlos.generators.filters import avlos_endpoints
 
-env = Environment(loader=PackageLoader("avlos"), autoescape=select_autoescape())
+env = Environment(
+    loader=PackageLoader("avlos"),
+    autoescape=select_autoescape(),
+    auto_reload=False,
+    optimized=True,
+    cache_size=-1,
+)
 
+env.filters["endpoints"] = avlos_endpoints
 
-def process(instance, config):
-    env.filters["endpoints"] = avlos_endpoints
 
+def process(instance, config):
     template = env.get_template("device.dbc.jinja")
     os.makedirs(os.path.dirname(config["paths"]["output_file"]), exist_ok=True)
     with open(config["paths"]["output_file"], "w") as output_file:
-        print(
-            template.render(instance=instance),
-            file=output_file,
-        )
+        template.stream(instance=instance).dump(output_file)
+        output_file.write("\n")
@@ -5,10 +5,14 @@ Validates C identifiers, detects conflicts, and ensures consistency.
 
 import logging
 import re
+import weakref
 from typing import List
 
 _logger = logging.getLogger("avlos")
 
+# validate_all() results per device tree, see validate_all_cached()
+_validation_cache = weakref.WeakKeyDictionary()
+
 # C reserved words (C11 standard)
 C_RESERVED_WORDS = {
     "auto",
@@ -221,3 +225,24 @@ def validate_all(instance) -> List[str]:
     errors.extend(validate_function_names(instance))
 
     return errors
+
+
+def validate_all_cached(instance) -> List[str]:
+    """
+    Run all validations once per device tree and return list of errors.
+
+    Generators validate the tree on every process() call; when several generators
+    (or repeated runs) process the same deserialized instance, the result is
+    reused. Device trees are not mutated after deserialization. Entries are
+    dropped when the instance is garbage collected.
+
+    Args:
+        instance: Root node to validate
+
+    Returns:
+        List of all error messages (empty if validation passes)
+    """
+    errors = _validation_cache.get(instance)
+    if errors is None:
+        errors = _validation_cache[instance] = validate_all(instance)
+    return list(errors)
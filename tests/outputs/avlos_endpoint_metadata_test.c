@@ -0,0 +1,198 @@
+// avlos-gen-hash: 534cb0240d17c802ac41a885856057b2
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#include "avlos_endpoint_metadata_test.h"
+
+const Avlos_EndpointMeta avlos_endpoint_meta[] = {
+
+    /* avlos_sn */
+    [0] = {
+        .kind = AVLOS_EP_KIND_READ_ONLY,
+        .value_dtype = AVLOS_DTYPE_UINT32,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_nickname */
+    [1] = {
+        .kind = AVLOS_EP_KIND_READ_WRITE,
+        .value_dtype = AVLOS_DTYPE_STRING,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_errors */
+    [2] = {
+        .kind = AVLOS_EP_KIND_READ_ONLY,
+        .value_dtype = AVLOS_DTYPE_UINT8,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_Vbus */
+    [3] = {
+        .kind = AVLOS_EP_KIND_READ_ONLY,
+        .value_dtype = AVLOS_DTYPE_FLOAT,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_reset */
+    [4] = {
+        .kind = AVLOS_EP_KIND_CALL_NO_ARGS,
+        .value_dtype = AVLOS_DTYPE_VOID,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_move_to */
+    [5] = {
+        .kind = AVLOS_EP_KIND_CALL_WITH_ARGS,
+        .value_dtype = AVLOS_DTYPE_VOID,
+        .num_args = 1,
+        .arg_dtypes = {
+            AVLOS_DTYPE_FLOAT, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_controller_set_pos_vel_setpoints */
+    [6] = {
+        .kind = AVLOS_EP_KIND_CALL_WITH_ARGS,
+        .value_dtype = AVLOS_DTYPE_FLOAT,
+        .num_args = 2,
+        .arg_dtypes = {
+            AVLOS_DTYPE_FLOAT, 
+            AVLOS_DTYPE_FLOAT, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_controller_mode */
+    [7] = {
+        .kind = AVLOS_EP_KIND_READ_WRITE,
+        .value_dtype = AVLOS_DTYPE_UINT8,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_motor_R */
+    [8] = {
+        .kind = AVLOS_EP_KIND_READ_WRITE,
+        .value_dtype = AVLOS_DTYPE_FLOAT,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_motor_L */
+    [9] = {
+        .kind = AVLOS_EP_KIND_READ_WRITE,
+        .value_dtype = AVLOS_DTYPE_FLOAT,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_motor_errors */
+    [10] = {
+        .kind = AVLOS_EP_KIND_READ_ONLY,
+        .value_dtype = AVLOS_DTYPE_UINT8,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_encoder_position_estimate */
+    [11] = {
+        .kind = AVLOS_EP_KIND_READ_ONLY,
+        .value_dtype = AVLOS_DTYPE_FLOAT,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    },
+
+
+    /* avlos_encoder_bandwidth */
+    [12] = {
+        .kind = AVLOS_EP_KIND_READ_WRITE,
+        .value_dtype = AVLOS_DTYPE_FLOAT,
+        .num_args = 0,
+        .arg_dtypes = {
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID, 
+            AVLOS_DTYPE_VOID
+        }
+    }
+
+
+};
+
+const uint8_t avlos_endpoint_meta_count = sizeof(avlos_endpoint_meta) / sizeof(avlos_endpoint_meta[0]);
@@ -0,0 +1,23 @@
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#pragma once
+
+#include <test_cpp_helpers.hpp>
+
+class Controller_ : Node
+{
+    public:
+
+        Controller_(uint8_t _can_node_id, send_callback _send_cb, recv_callback _recv_cb, delay_us_callback _delay_us_cb, uint32_t _delay_us_value):
+            Node(_can_node_id, _send_cb, _recv_cb, _delay_us_cb, _delay_us_value) {};
+        float set_pos_vel_setpoints(float pos_setpoint, float vel_setpoint);
+        uint8_t get_mode(void);
+        void set_mode(uint8_t value);
+
+};
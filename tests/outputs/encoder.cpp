@@ -0,0 +1,38 @@
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#include <encoder.hpp>
+
+float Encoder_::get_position_estimate(void)
+{
+    float value = 0;
+    this->send(11, this->_data, 0, true);
+    if (this->recv(11, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        read_le(&value, this->_data);
+    }
+    return value;
+}
+
+float Encoder_::get_bandwidth(void)
+{
+    float value = 0;
+    this->send(12, this->_data, 0, true);
+    if (this->recv(12, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        read_le(&value, this->_data);
+    }
+    return value;
+}
+
+void Encoder_::set_bandwidth(float value)
+{
+    write_le(value, this->_data);
+    this->send(12, this->_data, sizeof(float), false);
+}
+
@@ -0,0 +1,45 @@
+// avlos-gen-hash: dc7abd3937103e24a2618895a16728ac
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#pragma once
+
+typedef enum
+{
+    AVLOS_RET_NOACTION,
+    AVLOS_RET_READ = 1,
+    AVLOS_RET_WRITE = 2,
+    AVLOS_RET_CALL = 3
+} Avlos_Return;
+
+typedef enum
+{
+    AVLOS_CMD_WRITE,
+    AVLOS_CMD_READ = 1
+} Avlos_Command;
+
+typedef enum
+{
+    ERRORS_NONE = 0,
+    ERRORS_UNDERVOLTAGE = (1 << 0)
+} errors_flags;
+
+typedef enum
+{
+    MOTOR_ERRORS_NONE = 0,
+    MOTOR_ERRORS_R_OUT_OF_RANGE = (1 << 0), 
+    MOTOR_ERRORS_L_OUT_OF_RANGE = (1 << 1), 
+    MOTOR_ERRORS_INVALID_POLE_PAIRS = (1 << 2)
+} motor_errors_flags;
+
+typedef enum
+{
+    CONTROLLER_MODE_IDLE = 0,
+    CONTROLLER_MODE_CLOSED_LOOP = 1,
+    CONTROLLER_MODE__MAX
+} controller_mode_options;
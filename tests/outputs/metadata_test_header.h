@@ -0,0 +1,170 @@
+// avlos-gen-hash: 534cb0240d17c802ac41a885856057b2
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#pragma once
+
+static const uint32_t avlos_proto_hash = 1304522656;
+extern uint8_t (*avlos_endpoints[13])(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+extern uint32_t _avlos_get_proto_hash(void);
+
+/*
+* avlos_sn
+*
+* Retrieve the unique device serial number.
+*
+* Endpoint ID: 0
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_sn(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_nickname
+*
+* Retrieve the device name
+*
+* Endpoint ID: 1
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_nickname(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_errors
+*
+* Retrieve any device errors.
+*
+* Endpoint ID: 2
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_errors(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_Vbus
+*
+* Retrieve the bus voltage.
+*
+* Endpoint ID: 3
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_Vbus(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_reset
+*
+* Reset the device.
+*
+* Endpoint ID: 4
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_reset(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_move_to
+*
+* Move to
+*
+* Endpoint ID: 5
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_move_to(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_controller_set_pos_vel_setpoints
+*
+* Set position and velocity setpoints.
+*
+* Endpoint ID: 6
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_controller_set_pos_vel_setpoints(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_controller_mode
+*
+* Control mode
+*
+* Endpoint ID: 7
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_controller_mode(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_motor_R
+*
+* Access the motor Resistance value.
+*
+* Endpoint ID: 8
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_motor_R(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_motor_L
+*
+* Access the motor Inductance value.
+*
+* Endpoint ID: 9
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_motor_L(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_motor_errors
+*
+* Retrieve any motor errors.
+*
+* Endpoint ID: 10
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_motor_errors(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_encoder_position_estimate
+*
+* Retrieve the encoder position estimate.
+*
+* Endpoint ID: 11
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_encoder_position_estimate(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_encoder_bandwidth
+*
+* Access the encoder observer bandwidth.
+*
+* Endpoint ID: 12
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_encoder_bandwidth(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
@@ -0,0 +1,55 @@
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#include <motor.hpp>
+
+float Motor_::get_R(void)
+{
+    float value = 0;
+    this->send(8, this->_data, 0, true);
+    if (this->recv(8, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        read_le(&value, this->_data);
+    }
+    return value;
+}
+
+void Motor_::set_R(float value)
+{
+    write_le(value, this->_data);
+    this->send(8, this->_data, sizeof(float), false);
+}
+
+float Motor_::get_L(void)
+{
+    float value = 0;
+    this->send(9, this->_data, 0, true);
+    if (this->recv(9, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        read_le(&value, this->_data);
+    }
+    return value;
+}
+
+void Motor_::set_L(float value)
+{
+    write_le(value, this->_data);
+    this->send(9, this->_data, sizeof(float), false);
+}
+
+uint8_t Motor_::get_errors(void)
+{
+    uint8_t value = 0;
+    this->send(10, this->_data, 0, true);
+    if (this->recv(10, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        read_le(&value, this->_data);
+    }
+    return value;
+}
+
@@ -0,0 +1,60 @@
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#pragma once
+
+#include <tm_helpers.hpp>
+#include <dust>
+#include <test>
+#include <controller.hpp>
+#include <motor.hpp>
+#include <encoder.hpp>
+
+static uint32_t avlos_proto_hash = 1304522656;
+
+enum errors_flags
+{
+    ERRORS_NONE = 0,
+    ERRORS_UNDERVOLTAGE = (1 << 0)
+};
+
+enum motor_errors_flags
+{
+    MOTOR_ERRORS_NONE = 0,
+    MOTOR_ERRORS_R_OUT_OF_RANGE = (1 << 0), 
+    MOTOR_ERRORS_L_OUT_OF_RANGE = (1 << 1), 
+    MOTOR_ERRORS_INVALID_POLE_PAIRS = (1 << 2)
+};
+
+enum controller_mode_options
+{
+    CONTROLLER_MODE_IDLE = 0, 
+    CONTROLLER_MODE_CLOSED_LOOP = 1
+};
+
+class My_device : Node
+{
+    public:
+
+        My_device(uint8_t _can_node_id, send_callback _send_cb, recv_callback _recv_cb, delay_us_callback _delay_us_cb, uint32_t _delay_us_value):
+            Node(_can_node_id, _send_cb, _recv_cb, _delay_us_cb, _delay_us_value)
+            , controller(_can_node_id, _send_cb, _recv_cb, _delay_us_cb, _delay_us_value)
+            , motor(_can_node_id, _send_cb, _recv_cb, _delay_us_cb, _delay_us_value)
+            , encoder(_can_node_id, _send_cb, _recv_cb, _delay_us_cb, _delay_us_value) {};
+        uint32_t get_sn(void);
+        void get_nickname(char out_value[]);
+        void set_nickname(char value[]);
+        uint8_t get_errors(void);
+        float get_Vbus(void);
+        void reset();
+        void move_to(float position);
+        Controller_ controller;
+        Motor_ motor;
+        Encoder_ encoder;
+
+};
@@ -0,0 +1,158 @@
+// avlos-gen-hash: 1e7099f7e0e30cad1bd06398dd6df079
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#pragma once
+
+static const uint32_t avlos_proto_hash = 2504321549;
+extern uint8_t (*avlos_endpoints[12])(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+extern uint32_t _avlos_get_proto_hash(void);
+
+/*
+* avlos_u8_val
+*
+* uint8 value
+*
+* Endpoint ID: 0
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_u8_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_i8_val
+*
+* int8 value
+*
+* Endpoint ID: 1
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_i8_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_u16_val
+*
+* uint16 value
+*
+* Endpoint ID: 2
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_u16_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_i16_val
+*
+* int16 value
+*
+* Endpoint ID: 3
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_i16_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_u32_val
+*
+* uint32 value
+*
+* Endpoint ID: 4
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_u32_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_i32_val
+*
+* int32 value
+*
+* Endpoint ID: 5
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_i32_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_u64_val
+*
+* uint64 value
+*
+* Endpoint ID: 6
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_u64_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_i64_val
+*
+* int64 value
+*
+* Endpoint ID: 7
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_i64_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_float_val
+*
+* float value
+*
+* Endpoint ID: 8
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_float_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_double_val
+*
+* double value
+*
+* Endpoint ID: 9
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_double_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_str_val
+*
+* string value
+*
+* Endpoint ID: 10
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_str_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
+
+/*
+* avlos_bool_val
+*
+* bool value
+*
+* Endpoint ID: 11
+*
+* @param buffer
+* @param buffer_len
+*/
+uint8_t avlos_bool_val(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd);
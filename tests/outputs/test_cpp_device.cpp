@@ -0,0 +1,62 @@
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+#include <test_cpp_device.hpp>
+uint32_t Test_cpp_device::get_sn(void)
+{
+    uint32_t value = 0;
+    this->send(0, this->_data, 0, true);
+    if (this->recv(0, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        read_le(&value, this->_data);
+    }
+    return value;
+}
+void Test_cpp_device::get_nickname(char out_value[])
+{
+    this->send(1, this->_data, 0, true);
+    this->_dlc = 0;
+    if (this->recv(1, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        memcpy(out_value, this->_data, this->_dlc);
+    }
+}
+void Test_cpp_device::set_nickname(char value[])
+{
+    memcpy(this->_data, value, sizeof(value));
+    this->send(1, this->_data, sizeof(value), false);
+}
+uint8_t Test_cpp_device::get_errors(void)
+{
+    uint8_t value = 0;
+    this->send(2, this->_data, 0, true);
+    if (this->recv(2, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        read_le(&value, this->_data);
+    }
+    return value;
+}
+float Test_cpp_device::get_Vbus(void)
+{
+    float value = 0;
+    this->send(3, this->_data, 0, true);
+    if (this->recv(3, this->_data, &(this->_dlc), this->delay_us_value))
+    {
+        read_le(&value, this->_data);
+    }
+    return value;
+}
+
+void Test_cpp_device::reset()
+{
+    this->send(4, this->_data, 0, true);
+}
+
+void Test_cpp_device::move_to(float position)
+{
+    this->send(5, this->_data, 0, true);
+}
@@ -0,0 +1,203 @@
+// avlos-gen-hash: 641ebc6eeae692fa258908f356b82433
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+static inline uint8_t _avlos_getter_string(uint8_t *buffer, uint8_t *buffer_len, uint8_t (*getter)(char*)) {
+    *buffer_len = getter((char *)buffer);
+    return AVLOS_RET_READ;
+}
+
+static inline uint8_t _avlos_setter_string(const uint8_t *buffer, void (*setter)(const char*)) {
+    setter((const char *)buffer);
+    return AVLOS_RET_WRITE;
+}
+
+
+uint8_t (*avlos_endpoints[13])(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd) = {&avlos_sn, &avlos_nickname, &avlos_errors, &avlos_Vbus, &avlos_reset, &avlos_move_to, &avlos_controller_set_pos_vel_setpoints, &avlos_controller_mode, &avlos_motor_R, &avlos_motor_L, &avlos_motor_errors, &avlos_encoder_position_estimate, &avlos_encoder_bandwidth };
+
+uint32_t _avlos_get_proto_hash(void)
+{
+    return avlos_proto_hash;
+}
+
+uint8_t avlos_sn(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        uint32_t v;
+        v = system_get_sn();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+uint8_t avlos_nickname(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        return _avlos_getter_string(buffer, buffer_len, system_get_name);
+    }
+else if (AVLOS_CMD_WRITE == cmd) {
+        return _avlos_setter_string(buffer, system_set_name);
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+uint8_t avlos_errors(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        uint8_t v;
+        v = system_get_error();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+uint8_t avlos_Vbus(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        float v;
+        v = system_get_vbus();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+uint8_t avlos_reset(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+    system_reset();
+
+    return AVLOS_RET_CALL;
+}
+
+TM_RAMFUNC uint8_t avlos_move_to(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+    uint8_t _offset = 0;
+    float position;
+    memcpy(&position, buffer+_offset, sizeof(position));
+    _offset += sizeof(position);
+    move_to(position);
+
+    return AVLOS_RET_CALL;
+}
+
+uint8_t avlos_controller_set_pos_vel_setpoints(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+    uint8_t _offset = 0;
+    float pos_setpoint;
+    memcpy(&pos_setpoint, buffer+_offset, sizeof(pos_setpoint));
+    _offset += sizeof(pos_setpoint);
+    float vel_setpoint;
+    memcpy(&vel_setpoint, buffer+_offset, sizeof(vel_setpoint));
+    _offset += sizeof(vel_setpoint);
+    float ret_val = set_position_velocity_setpoints(pos_setpoint, vel_setpoint);
+    memcpy(buffer, &ret_val, sizeof(ret_val));
+    *buffer_len = sizeof(ret_val);
+
+    return AVLOS_RET_CALL;
+}
+
+uint8_t avlos_controller_mode(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        uint8_t v;
+        v = controller_get_mode();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+else if (AVLOS_CMD_WRITE == cmd) {
+        uint8_t v;
+        memcpy(&v, buffer, sizeof(v));
+        controller_set_mode(v);
+        return AVLOS_RET_WRITE;
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+uint8_t avlos_motor_R(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        float v;
+        v = motor_get_R();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+else if (AVLOS_CMD_WRITE == cmd) {
+        float v;
+        memcpy(&v, buffer, sizeof(v));
+        motor_set_R(v);
+        return AVLOS_RET_WRITE;
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+uint8_t avlos_motor_L(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        float v;
+        v = motor_get_L();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+else if (AVLOS_CMD_WRITE == cmd) {
+        float v;
+        memcpy(&v, buffer, sizeof(v));
+        motor_set_L(v);
+        return AVLOS_RET_WRITE;
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+uint8_t avlos_motor_errors(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        uint8_t v;
+        v = system_get_error();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+TM_RAMFUNC uint8_t avlos_encoder_position_estimate(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        float v;
+        v = encoder_get_pos_estimate();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+    return AVLOS_RET_NOACTION;
+}
+
+TM_RAMFUNC uint8_t avlos_encoder_bandwidth(uint8_t * buffer, uint8_t * buffer_len, Avlos_Command cmd)
+{
+if (AVLOS_CMD_READ == cmd) {
+        float v;
+        v = encoder_get_bandwidth();
+        *buffer_len = sizeof(v);
+        memcpy(buffer, &v, sizeof(v));
+        return AVLOS_RET_READ;
+    }
+else if (AVLOS_CMD_WRITE == cmd) {
+        float v;
+        memcpy(&v, buffer, sizeof(v));
+        encoder_set_bandwidth(v);
+        return AVLOS_RET_WRITE;
+    }
+    return AVLOS_RET_NOACTION;
+}
@@ -0,0 +1,25 @@
+/*
+* This file was automatically generated using Avlos.
+* https://github.com/tinymovr/avlos
+*
+* Any changes to this file will be overwritten when
+* content is regenerated.
+*/
+
+#pragma once
+
+#include <tinymovr_test_helpers.hpp>
+
+class Watchdog_ : Node
+{
+    public:
+
+        Watchdog_(uint8_t _can_node_id, send_callback _send_cb, recv_callback _recv_cb, delay_us_callback _delay_us_cb, uint32_t _delay_us_value):
+            Node(_can_node_id, _send_cb, _recv_cb, _delay_us_cb, _delay_us_value) {};
+        bool get_enabled(void);
+        void set_enabled(bool value);
+        bool get_triggered(void);
+        float get_timeout(void);
+        void set_timeout(float value);
+
+};
@@ -279,6 +279,20 @@ class TestDataModelProperties(unittest.TestCase):
                         f"Endpoint {ep.name} should have consistent getter/setter strategies",
                     )
 
+    def test_endpoints_in_declaration_order(self):
+        """Test that avlos_endpoints returns endpoints depth-first in declaration (ep_id) order."""
+        import importlib.resources
+
+        from avlos.generators.filters import avlos_endpoints
+
+        def_path_str = str(importlib.resources.files("tests").joinpath("definition/tinymovr_2_3_x.yaml"))
+
+        with open(def_path_str) as device_desc_stream:
+            obj = deserialize(yaml.safe_load(device_desc_stream))
+
+        ep_ids = [ep.ep_id for ep in avlos_endpoints(obj)]
+        self.assertEqual(ep_ids, list(range(len(ep_ids))))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,7 +14,7 @@ import yaml
 
 from avlos.deserializer import deserialize
 from avlos.generators import generator_c
-from avlos.generators.filters import avlos_endpoints
+from avlos.generators.filters import avlos_endpoints, avlos_precompute_meta
 
 
 class TestMetadataGeneration(unittest.TestCase):
@@ -84,6 +84,18 @@ class TestMetadataGeneration(unittest.TestCase):
         # num_args = 2 for this endpoint
         self.assertIn(".num_args = 2", content)
 
+    def test_precompute_meta_rows(self):
+        """avlos_precompute_meta yields one resolved row per endpoint, arg_dtypes padded to four."""
+        rows = avlos_precompute_meta(self.device)
+        self.assertEqual([r["ep_id"] for r in rows], [ep.ep_id for ep in avlos_endpoints(self.device)])
+        row = next(r for r in rows if r["endpoint_function_name"] == "avlos_controller_set_pos_vel_setpoints")
+        self.assertEqual(row["kind"], "AVLOS_EP_KIND_CALL_WITH_ARGS")
+        self.assertEqual(row["num_args"], 2)
+        self.assertEqual(
+            row["arg_dtypes"],
+            ["AVLOS_DTYPE_FLOAT", "AVLOS_DTYPE_FLOAT", "AVLOS_DTYPE_VOID", "AVLOS_DTYPE_VOID"],
+        )
+
     def test_metadata_not_required(self):
         """Generator runs successfully without metadata paths (backward compatibility)."""
         # Use a path we never pass to the generator; without metadata keys it must not be created
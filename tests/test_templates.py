@@ -355,6 +355,74 @@ class TestIntegration(unittest.TestCase):
         self.assertIn("AVLOS_CMD_READ", content)
         self.assertIn("avlos_endpoints[", content)
 
+    def test_c_generation_skipped_when_up_to_date(self):
+        """Test that C generation is skipped when outputs match the inputs' fingerprint."""
+        def_path_str = str(importlib.resources.files("tests").joinpath("definition/good_device.yaml"))
+
+        with open(def_path_str) as device_desc_stream:
+            obj = deserialize(yaml.safe_load(device_desc_stream))
+
+        output_impl = str(importlib.resources.files("tests").joinpath("outputs/test_uptodate.c"))
+        config = {
+            "paths": {
+                "output_enums": str(importlib.resources.files("tests").joinpath("outputs/test_uptodate_enum.h")),
+                "output_header": str(importlib.resources.files("tests").joinpath("outputs/test_uptodate_header.h")),
+                "output_impl": output_impl,
+            },
+        }
+
+        generator_c.process(obj, config)
+        with open(output_impl) as f:
+            self.assertTrue(f.readline().startswith("// avlos-gen-hash: "))
+        with open(output_impl, "a") as f:
+            f.write("/* sentinel */\n")
+
+        # Identical inputs: outputs are left untouched
+        generator_c.process(obj, config)
+        with open(output_impl) as f:
+            self.assertIn("/* sentinel */", f.read())
+
+        # Undecodable existing output: treated as stale and overwritten
+        with open(config["paths"]["output_enums"], "wb") as f:
+            f.write(b"\xff\xfe\x00garbage\n")
+        generator_c.process(obj, config)
+        with open(config["paths"]["output_enums"], "rb") as f:
+            self.assertTrue(f.readline().startswith(b"// avlos-gen-hash: "))
+
+        # Changed config: outputs are regenerated
+        config["impl_includes"] = ["stdio.h"]
+        generator_c.process(obj, config)
+        with open(output_impl) as f:
+            self.assertNotIn("/* sentinel */", f.read())
+
+        # Style "file" depends on a .clang-format the fingerprint cannot see: always regenerated
+        config["format_style"] = "file"
+        generator_c.process(obj, config)
+        with open(output_impl, "a") as f:
+            f.write("/* sentinel */\n")
+        generator_c.process(obj, config)
+        with open(output_impl) as f:
+            self.assertNotIn("/* sentinel */", f.read())
+
+        # Output location does not change the fingerprint
+        hash_lines = []
+        for subdir in ("uptodate_a", "uptodate_b"):
+            out_dir = importlib.resources.files("tests").joinpath(f"outputs/{subdir}")
+            impl_path = str(out_dir / "test_uptodate.c")
+            generator_c.process(
+                obj,
+                {
+                    "paths": {
+                        "output_enums": str(out_dir / "test_uptodate_enum.h"),
+                        "output_header": str(out_dir / "test_uptodate_header.h"),
+                        "output_impl": impl_path,
+                    },
+                },
+            )
+            with open(impl_path) as f:
+                hash_lines.append(f.readline())
+        self.assertEqual(hash_lines[0], hash_lines[1])
+
     def test_cpp_generation_pipeline(self):
         """Test complete C++ generation pipeline."""
         import importlib.resources
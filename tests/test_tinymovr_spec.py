@@ -2,8 +2,14 @@
 Tests for Tinymovr specification parsing and code generation.
 """
 
+import functools
 import importlib.resources
+import math
+import mmap
 import os
+import pathlib
+import re
+import tempfile
 import unittest
 
 import yaml
@@ -16,6 +22,42 @@ from avlos.definitions.remote_function import RemoteFunction
 from avlos.deserializer import deserialize
 from avlos.generators import generator_c, generator_cpp
 
+# libyaml-backed loader when available; same output as yaml.safe_load
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_bytes():
+    """Raw bytes of the Tinymovr specification; libyaml decodes them directly."""
+    return importlib.resources.files("tests").joinpath("definition/tinymovr_2_3_x.yaml").read_bytes()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_device():
+    """Deserialize the Tinymovr specification once; tests only read from it."""
+    return deserialize(yaml.load(_yaml_bytes(), Loader=YAML_LOADER))
+
+
+def _flatten(node):
+    """Return all attributes below node (including nested groups), depth-first in declaration order."""
+    out = []
+    stack = list(reversed(node.remote_attributes.values()))
+    while stack:
+        attr = stack.pop()
+        out.append(attr)
+        sub = getattr(attr, "remote_attributes", None)
+        if sub:
+            stack.extend(reversed(sub.values()))
+    return out
+
+
+def _find_needles(needles, content):
+    """Return which of needles occur in content (str or bytes), scanning it once with a regex alternation."""
+    sep = b"|" if isinstance(needles[0], bytes) else "|"
+    # Matches do not overlap, so needles should not be substrings of one another
+    rx = re.compile(sep.join(map(re.escape, needles)))
+    return {m.group() for m in rx.finditer(content)}
+
 
 class TestTinymovr_Parsing(unittest.TestCase):
     """Test parsing of Tinymovr specification."""
@@ -23,10 +65,7 @@ class TestTinymovr_Parsing(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load the Tinymovr specification once for all tests."""
-        def_path_str = str(importlib.resources.files("tests").joinpath("definition/tinymovr_2_3_x.yaml"))
-
-        with open(def_path_str) as device_desc_stream:
-            cls.device = deserialize(yaml.safe_load(device_desc_stream))
+        cls.device = _load_device()
 
     def test_device_loaded(self):
         """Test that device specification loads successfully."""
@@ -35,39 +74,33 @@ class TestTinymovr_Parsing(unittest.TestCase):
 
     def test_root_level_attributes(self):
         """Test that root-level attributes are parsed correctly."""
-        attr_names = [attr.name for attr in self.device.remote_attributes.values()]
+        attr_names = {attr.name for attr in self.device.remote_attributes.values()}
 
         # Test for specific root attributes
-        self.assertIn("protocol_hash", attr_names)
-        self.assertIn("uid", attr_names)
-        self.assertIn("fw_version", attr_names)
-        self.assertIn("Vbus", attr_names)
-        self.assertIn("temp", attr_names)
-        self.assertIn("calibrated", attr_names)
+        self.assertLessEqual({"protocol_hash", "uid", "fw_version", "Vbus", "temp", "calibrated"}, attr_names)
 
     def test_nested_attributes(self):
         """Test that nested remote_attributes are parsed correctly."""
         # Find scheduler attribute
-        scheduler = next((attr for attr in self.device.remote_attributes.values() if attr.name == "scheduler"), None)
-        self.assertIsNotNone(scheduler)
+        self.assertIn("scheduler", self.device.remote_attributes)
+        scheduler = self.device.remote_attributes["scheduler"]
 
         # Check it has nested attributes
-        self.assertTrue(hasattr(scheduler, "remote_attributes"))
-        self.assertGreater(len(scheduler.remote_attributes), 0)
+        nested = getattr(scheduler, "remote_attributes", None)
+        self.assertTrue(nested)
 
         # Check nested attribute names
-        nested_names = [attr.name for attr in scheduler.remote_attributes.values()]
-        self.assertIn("load", nested_names)
-        self.assertIn("warnings", nested_names)
+        nested_names = {attr.name for attr in nested.values()}
+        self.assertLessEqual({"load", "warnings"}, nested_names)
 
     def test_deeply_nested_attributes(self):
         """Test that deeply nested attributes (3+ levels) are parsed correctly."""
         # Find controller.position.setpoint (3 levels deep)
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
-        self.assertIsNotNone(controller)
+        self.assertIn("controller", self.device.remote_attributes)
+        controller = self.device.remote_attributes["controller"]
 
-        position = next((attr for attr in controller.remote_attributes.values() if attr.name == "position"), None)
-        self.assertIsNotNone(position)
+        self.assertIn("position", controller.remote_attributes)
+        position = controller.remote_attributes["position"]
 
         nested_names = [attr.name for attr in position.remote_attributes.values()]
         self.assertIn("setpoint", nested_names)
@@ -75,74 +108,60 @@ class TestTinymovr_Parsing(unittest.TestCase):
 
     def test_data_types(self):
         """Test that various data types are parsed correctly."""
-        # uint32
-        uid_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "uid"), None)
-        self.assertEqual(uid_attr.dtype, DataType.UINT32)
-
-        # float
-        vbus_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "Vbus"), None)
-        self.assertEqual(vbus_attr.dtype, DataType.FLOAT)
-
-        # bool
-        calibrated_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "calibrated"), None)
-        self.assertEqual(calibrated_attr.dtype, DataType.BOOL)
-
-        # string
-        fw_version_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "fw_version"), None)
-        self.assertEqual(fw_version_attr.dtype, DataType.STR)
+        for name, expected_dtype in (
+            ("uid", DataType.UINT32),
+            ("Vbus", DataType.FLOAT),
+            ("calibrated", DataType.BOOL),
+            ("fw_version", DataType.STR),
+        ):
+            with self.subTest(name=name):
+                self.assertEqual(self.device.remote_attributes[name].dtype, expected_dtype)
 
     def test_getter_setter_names(self):
         """Test that getter and setter names are parsed correctly."""
         # Attribute with only getter
-        uid_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "uid"), None)
+        uid_attr = self.device.remote_attributes["uid"]
         self.assertEqual(uid_attr.getter_name, "system_get_uid")
         self.assertIsNone(uid_attr.setter_name)
 
         # Attribute with both getter and setter (need to find one in controller)
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
-        state_attr = next((attr for attr in controller.remote_attributes.values() if attr.name == "state"), None)
+        controller = self.device.remote_attributes["controller"]
+        state_attr = controller.remote_attributes["state"]
         self.assertEqual(state_attr.getter_name, "controller_get_state")
         self.assertEqual(state_attr.setter_name, "controller_set_state")
 
     def test_enum_attributes(self):
         """Test that attributes with options (enums) are parsed correctly."""
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
+        controller = self.device.remote_attributes["controller"]
 
         # Test controller.state enum
-        state_attr = next((attr for attr in controller.remote_attributes.values() if attr.name == "state"), None)
+        state_attr = controller.remote_attributes["state"]
         self.assertIsInstance(state_attr, RemoteEnum)
-        member_names = [m.name for m in state_attr.options]
-        self.assertIn("IDLE", member_names)
-        self.assertIn("CALIBRATE", member_names)
-        self.assertIn("CL_CONTROL", member_names)
+        member_names = {m.name for m in state_attr.options}
+        self.assertLessEqual({"IDLE", "CALIBRATE", "CL_CONTROL"}, member_names)
 
         # Test controller.mode enum
-        mode_attr = next((attr for attr in controller.remote_attributes.values() if attr.name == "mode"), None)
+        mode_attr = controller.remote_attributes["mode"]
         self.assertIsInstance(mode_attr, RemoteEnum)
-        member_names = [m.name for m in mode_attr.options]
-        self.assertIn("CURRENT", member_names)
-        self.assertIn("VELOCITY", member_names)
-        self.assertIn("POSITION", member_names)
-        self.assertIn("TRAJECTORY", member_names)
-        self.assertIn("HOMING", member_names)
+        member_names = {m.name for m in mode_attr.options}
+        self.assertLessEqual({"CURRENT", "VELOCITY", "POSITION", "TRAJECTORY", "HOMING"}, member_names)
 
     def test_bitmask_attributes(self):
         """Test that attributes with flags (bitmasks) are parsed correctly."""
         # Test root-level errors bitmask
-        errors_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "errors"), None)
+        errors_attr = self.device.remote_attributes["errors"]
         self.assertIsInstance(errors_attr, RemoteBitmask)
-        self.assertIn("UNDERVOLTAGE", errors_attr.bitmask.__members__)
+        self.assertLessEqual({"UNDERVOLTAGE"}, errors_attr.bitmask.__members__.keys())
 
         # Test warnings bitmask
-        warnings_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "warnings"), None)
+        warnings_attr = self.device.remote_attributes["warnings"]
         self.assertIsInstance(warnings_attr, RemoteBitmask)
-        self.assertIn("DRIVER_FAULT", warnings_attr.bitmask.__members__)
-        self.assertIn("CHARGE_PUMP_FAULT_STAT", warnings_attr.bitmask.__members__)
+        self.assertLessEqual({"DRIVER_FAULT", "CHARGE_PUMP_FAULT_STAT"}, warnings_attr.bitmask.__members__.keys())
 
     def test_function_attributes(self):
         """Test that function attributes are parsed correctly."""
         # Test void function without arguments
-        reset_func = next((attr for attr in self.device.remote_attributes.values() if attr.name == "reset"), None)
+        reset_func = self.device.remote_attributes["reset"]
         self.assertIsInstance(reset_func, RemoteFunction)
         self.assertEqual(reset_func.dtype, DataType.VOID)
         self.assertEqual(reset_func.caller_name, "system_reset")
@@ -150,65 +169,61 @@ class TestTinymovr_Parsing(unittest.TestCase):
 
     def test_function_with_return_value(self):
         """Test that functions with return values are parsed correctly."""
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
+        controller = self.device.remote_attributes["controller"]
 
         # Test set_pos_vel_setpoints function (returns float)
-        func = next((attr for attr in controller.remote_attributes.values() if attr.name == "set_pos_vel_setpoints"), None)
+        func = controller.remote_attributes["set_pos_vel_setpoints"]
         self.assertIsInstance(func, RemoteFunction)
         self.assertEqual(func.dtype, DataType.FLOAT)
         self.assertEqual(func.caller_name, "controller_set_pos_vel_setpoints_user_frame")
 
     def test_function_with_arguments(self):
         """Test that functions with arguments are parsed correctly."""
-        traj_planner = next((attr for attr in self.device.remote_attributes.values() if attr.name == "traj_planner"), None)
+        traj_planner = self.device.remote_attributes["traj_planner"]
 
         # Test move_to function (has 1 argument)
-        move_to_func = next((attr for attr in traj_planner.remote_attributes.values() if attr.name == "move_to"), None)
+        move_to_func = traj_planner.remote_attributes["move_to"]
         self.assertIsInstance(move_to_func, RemoteFunction)
         self.assertEqual(len(move_to_func.arguments), 1)
         self.assertEqual(move_to_func.arguments[0].name, "pos_setpoint")
         self.assertEqual(move_to_func.arguments[0].dtype, DataType.FLOAT)
 
         # Test set_pos_vel_setpoints function (has 2 arguments)
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
-        func = next((attr for attr in controller.remote_attributes.values() if attr.name == "set_pos_vel_setpoints"), None)
+        controller = self.device.remote_attributes["controller"]
+        func = controller.remote_attributes["set_pos_vel_setpoints"]
         self.assertEqual(len(func.arguments), 2)
         self.assertEqual(func.arguments[0].name, "pos_setpoint")
         self.assertEqual(func.arguments[1].name, "vel_setpoint")
 
     def test_units(self):
         """Test that units are parsed correctly."""
-        # Test volt unit
-        vbus_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "Vbus"), None)
-        self.assertEqual(str(vbus_attr.unit), "volt")
-
-        # Test ampere unit
-        ibus_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "Ibus"), None)
-        self.assertEqual(str(ibus_attr.unit), "ampere")
-
-        # Test degC unit
-        temp_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "temp"), None)
-        self.assertEqual(str(temp_attr.unit), "degree_Celsius")
+        for name, expected_unit in (
+            ("Vbus", "volt"),
+            ("Ibus", "ampere"),
+            ("temp", "degree_Celsius"),
+        ):
+            with self.subTest(name=name):
+                self.assertEqual(str(self.device.remote_attributes[name].unit), expected_unit)
 
     def test_metadata(self):
         """Test that metadata is parsed correctly."""
         # Test dynamic flag
-        vbus_attr = next((attr for attr in self.device.remote_attributes.values() if attr.name == "Vbus"), None)
+        vbus_attr = self.device.remote_attributes["Vbus"]
         self.assertIsNotNone(vbus_attr.meta)
         self.assertTrue(vbus_attr.meta.get("dynamic", False))
 
         # Test export flag
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
-        position = next((attr for attr in controller.remote_attributes.values() if attr.name == "position"), None)
-        p_gain_attr = next((attr for attr in position.remote_attributes.values() if attr.name == "p_gain"), None)
+        controller = self.device.remote_attributes["controller"]
+        position = controller.remote_attributes["position"]
+        p_gain_attr = position.remote_attributes["p_gain"]
         self.assertTrue(p_gain_attr.meta.get("export", False))
 
         # Test reload_data flag
-        reset_func = next((attr for attr in self.device.remote_attributes.values() if attr.name == "reset"), None)
+        reset_func = self.device.remote_attributes["reset"]
         self.assertTrue(reset_func.meta.get("reload_data", False))
 
         # Test jog_step metadata
-        setpoint_attr = next((attr for attr in position.remote_attributes.values() if attr.name == "setpoint"), None)
+        setpoint_attr = position.remote_attributes["setpoint"]
         self.assertEqual(setpoint_attr.meta.get("jog_step"), 100)
 
     def test_attribute_count(self):
@@ -217,261 +232,181 @@ class TestTinymovr_Parsing(unittest.TestCase):
         self.assertGreater(len(self.device.remote_attributes), 10)
 
         # Controller should have many nested attributes
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
+        controller = self.device.remote_attributes["controller"]
         self.assertGreater(len(controller.remote_attributes), 10)
 
         # Sensors should have complex nesting
-        sensors = next((attr for attr in self.device.remote_attributes.values() if attr.name == "sensors"), None)
-        self.assertIsNotNone(sensors)
+        self.assertIn("sensors", self.device.remote_attributes)
+        sensors = self.device.remote_attributes["sensors"]
         self.assertGreater(len(sensors.remote_attributes), 2)
 
     def test_full_name_generation(self):
         """Test that full names are generated correctly for nested attributes."""
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
-        position = next((attr for attr in controller.remote_attributes.values() if attr.name == "position"), None)
-        setpoint_attr = next((attr for attr in position.remote_attributes.values() if attr.name == "setpoint"), None)
+        controller = self.device.remote_attributes["controller"]
+        position = controller.remote_attributes["position"]
+        setpoint_attr = position.remote_attributes["setpoint"]
 
         # Full name should be dot-separated
         self.assertEqual(setpoint_attr.full_name, "controller.position.setpoint")
 
     def test_endpoint_function_name_generation(self):
         """Test that endpoint function names are generated correctly."""
-        controller = next((attr for attr in self.device.remote_attributes.values() if attr.name == "controller"), None)
-        position = next((attr for attr in controller.remote_attributes.values() if attr.name == "position"), None)
-        setpoint_attr = next((attr for attr in position.remote_attributes.values() if attr.name == "setpoint"), None)
+        controller = self.device.remote_attributes["controller"]
+        position = controller.remote_attributes["position"]
+        setpoint_attr = position.remote_attributes["setpoint"]
 
         # Endpoint function name should be avlos_ + full_name with underscores
         self.assertEqual(setpoint_attr.endpoint_function_name, "avlos_controller_position_setpoint")
 
 
-class TestTinymovr_CodeGeneration(unittest.TestCase):
-    """Test code generation from Tinymovr specification."""
+class TestTinymovr_CGen(unittest.TestCase):
+    """Test C code generation from Tinymovr specification."""
 
     @classmethod
     def setUpClass(cls):
-        """Load the Tinymovr specification once for all tests."""
-        def_path_str = str(importlib.resources.files("tests").joinpath("definition/tinymovr_2_3_x.yaml"))
+        """Load the Tinymovr specification and generate C code once for all tests."""
+        cls.device = _load_device()
+        cls._all_attrs = _flatten(cls.device)
+
+        # Generated files are only inspected here, so keep them out of tests/outputs
+        cls._tmp = tempfile.TemporaryDirectory()
+        root = pathlib.Path(cls._tmp.name)
+        cls._c_paths = {
+            "output_enums": str(root / "tinymovr_test_enum.h"),
+            "output_header": str(root / "tinymovr_test_header.h"),
+            "output_impl": str(root / "tinymovr_test.c"),
+        }
 
-        with open(def_path_str) as device_desc_stream:
-            cls.device = deserialize(yaml.safe_load(device_desc_stream))
+        generator_c.process(cls.device, {"hash_string": "0xTINYMOVR", "paths": cls._c_paths})
+        # Read-only view of the generated source; find() scans the page cache without copying
+        cls._c_impl_file = open(cls._c_paths["output_impl"], "rb")
+        cls._c_impl_mm = mmap.mmap(cls._c_impl_file.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(cls._c_paths["output_enums"]) as f:
+            cls._c_enum = f.read()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Release the mapped C output and remove the generated files."""
+        cls._c_impl_mm.close()
+        cls._c_impl_file.close()
+        cls._tmp.cleanup()
 
     def test_c_generation_succeeds(self):
         """Test that C code generation completes without errors."""
-        output_impl = str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.c"))
-
-        config = {
-            "hash_string": "0xTINYMOVR",
-            "paths": {
-                "output_enums": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_enum.h")),
-                "output_header": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_header.h")),
-                "output_impl": output_impl,
-            },
-        }
-
-        # Should not raise any exceptions
-        generator_c.process(self.device, config)
-
         # Verify files were created
-        self.assertTrue(os.path.exists(output_impl))
-        self.assertTrue(os.path.exists(config["paths"]["output_enums"]))
-        self.assertTrue(os.path.exists(config["paths"]["output_header"]))
+        self.assertTrue(os.path.exists(self._c_paths["output_impl"]))
+        self.assertTrue(os.path.exists(self._c_paths["output_enums"]))
+        self.assertTrue(os.path.exists(self._c_paths["output_header"]))
 
     def test_generated_c_contains_endpoint_functions(self):
         """Test that generated C code contains endpoint functions."""
-        output_impl = str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.c"))
-
-        config = {
-            "hash_string": "0xTINYMOVR",
-            "paths": {
-                "output_enums": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_enum.h")),
-                "output_header": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_header.h")),
-                "output_impl": output_impl,
-            },
-        }
-
-        generator_c.process(self.device, config)
-
-        with open(output_impl) as f:
-            content = f.read()
-
-        # Check for root-level endpoint functions
-        self.assertIn("avlos_protocol_hash", content)
-        self.assertIn("avlos_uid", content)
-        self.assertIn("avlos_fw_version", content)
-
-        # Check for nested endpoint functions
-        self.assertIn("avlos_controller_state", content)
-        self.assertIn("avlos_controller_position_setpoint", content)
-
-        # Check for function endpoints
-        self.assertIn("avlos_reset", content)
-        self.assertIn("avlos_controller_calibrate", content)
+        needles = (
+            # Root-level endpoint functions
+            b"avlos_protocol_hash",
+            b"avlos_uid",
+            b"avlos_fw_version",
+            # Nested endpoint functions
+            b"avlos_controller_state",
+            b"avlos_controller_position_setpoint",
+            # Function endpoints
+            b"avlos_reset",
+            b"avlos_controller_calibrate",
+        )
+        self.assertEqual(_find_needles(needles, self._c_impl_mm), set(needles))
 
     def test_generated_c_contains_enums(self):
         """Test that generated C code contains enum definitions."""
-        output_enum = str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_enum.h"))
-
-        config = {
-            "hash_string": "0xTINYMOVR",
-            "paths": {
-                "output_enums": output_enum,
-                "output_header": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_header.h")),
-                "output_impl": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.c")),
-            },
-        }
-
-        generator_c.process(self.device, config)
-
-        with open(output_enum) as f:
-            content = f.read()
-
-        # Check for enum type definitions
-        self.assertIn("typedef enum", content)
-
-        # Check for specific enum values
-        self.assertIn("CONTROLLER_STATE_IDLE", content)
-        self.assertIn("CONTROLLER_STATE_CALIBRATE", content)
-        self.assertIn("CONTROLLER_MODE_CURRENT", content)
-        self.assertIn("CONTROLLER_MODE_VELOCITY", content)
+        needles = (
+            "typedef enum",
+            "CONTROLLER_STATE_IDLE",
+            "CONTROLLER_STATE_CALIBRATE",
+            "CONTROLLER_MODE_CURRENT",
+            "CONTROLLER_MODE_VELOCITY",
+        )
+        self.assertEqual(_find_needles(needles, self._c_enum), set(needles))
 
     def test_generated_c_contains_bitmasks(self):
         """Test that generated C code contains bitmask definitions."""
-        output_enum = str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_enum.h"))
-
-        config = {
-            "hash_string": "0xTINYMOVR",
-            "paths": {
-                "output_enums": output_enum,
-                "output_header": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_header.h")),
-                "output_impl": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.c")),
-            },
-        }
-
-        generator_c.process(self.device, config)
-
-        with open(output_enum) as f:
-            content = f.read()
-
-        # Check for bitmask definitions
-        self.assertIn("ERRORS_UNDERVOLTAGE", content)
-        self.assertIn("WARNINGS_DRIVER_FAULT", content)
+        needles = ("ERRORS_UNDERVOLTAGE", "WARNINGS_DRIVER_FAULT")
+        self.assertEqual(_find_needles(needles, self._c_enum), set(needles))
 
     def test_generated_c_contains_string_helpers(self):
         """Test that generated C code contains string helper functions."""
-        output_impl = str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.c"))
-
-        config = {
-            "hash_string": "0xTINYMOVR",
-            "paths": {
-                "output_enums": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_enum.h")),
-                "output_header": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_header.h")),
-                "output_impl": output_impl,
-            },
-        }
-
-        generator_c.process(self.device, config)
-
-        with open(output_impl) as f:
-            content = f.read()
-
         # Should contain string helper functions (since fw_version is string type)
-        self.assertIn("_avlos_getter_string", content)
+        self.assertNotEqual(self._c_impl_mm.find(b"_avlos_getter_string"), -1)
 
     def test_generated_c_endpoint_array(self):
         """Test that generated C code contains the endpoint array."""
-        output_impl = str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.c"))
-
-        config = {
-            "hash_string": "0xTINYMOVR",
-            "paths": {
-                "output_enums": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_enum.h")),
-                "output_header": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_header.h")),
-                "output_impl": output_impl,
-            },
-        }
-
-        generator_c.process(self.device, config)
-
-        with open(output_impl) as f:
-            content = f.read()
-
         # Should have endpoint array
-        self.assertIn("avlos_endpoints[", content)
+        self.assertNotEqual(self._c_impl_mm.find(b"avlos_endpoints["), -1)
 
         # Should have proto hash function
-        self.assertIn("_avlos_get_proto_hash", content)
-
-    def test_cpp_generation_succeeds(self):
-        """Test that C++ code generation completes without errors."""
-        config = {
-            "hash_string": "0xTINYMOVR",
-            "paths": {
-                "output_helpers": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_helpers.hpp")),
-                "output_header": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.hpp")),
-                "output_impl": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.cpp")),
-            },
-        }
+        self.assertNotEqual(self._c_impl_mm.find(b"_avlos_get_proto_hash"), -1)
 
-        # Should not raise any exceptions
-        generator_cpp.process(self.device, config)
-
-        # Verify files were created
-        self.assertTrue(os.path.exists(config["paths"]["output_helpers"]))
-        self.assertTrue(os.path.exists(config["paths"]["output_header"]))
-        self.assertTrue(os.path.exists(config["paths"]["output_impl"]))
-
-    def test_generated_cpp_contains_classes(self):
-        """Test that generated C++ code contains class definitions."""
-        output_header = str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.hpp"))
-
-        config = {
-            "hash_string": "0xTINYMOVR",
-            "paths": {
-                "output_helpers": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test_helpers.hpp")),
-                "output_header": output_header,
-                "output_impl": str(importlib.resources.files("tests").joinpath("outputs/tinymovr_test.cpp")),
-            },
-        }
+    def test_attribute_index_generation(self):
+        """Test that attribute indices are generated correctly."""
+        # Collect ep_ids with count and range in a single pass
+        ep_ids = set()
+        count = 0
+        lo, hi = math.inf, -math.inf
+        for attr in self._all_attrs:
+            ep_id = getattr(attr, "ep_id", -1)
+            if ep_id >= 0:
+                ep_ids.add(ep_id)
+                count += 1
+                lo = ep_id if ep_id < lo else lo
+                hi = ep_id if ep_id > hi else hi
 
-        generator_cpp.process(self.device, config)
+        # Should have many endpoints (Tinymovr has over 70 endpoints)
+        self.assertGreater(count, 70)
 
-        with open(output_header) as f:
-            content = f.read()
+        # All ep_ids should be unique
+        self.assertEqual(len(ep_ids), count)
 
-        # Should contain class definitions
-        self.assertIn("class", content)
+        # ep_ids should start from 0
+        self.assertEqual(lo, 0)
 
-    def test_attribute_index_generation(self):
-        """Test that attribute indices are generated correctly."""
+        # ep_ids should be consecutive
+        self.assertEqual(hi, count - 1)
 
-        # Get all attributes as a flat list (including nested groups)
-        def get_all_attrs(obj, attrs_list=None):
-            if attrs_list is None:
-                attrs_list = []
-            for attr in obj.remote_attributes.values():
-                # Add this attribute to the list
-                attrs_list.append(attr)
-                # If it has nested attributes, recursively get those too
-                if hasattr(attr, "remote_attributes"):
-                    get_all_attrs(attr, attrs_list)
-            return attrs_list
 
-        all_attrs = get_all_attrs(self.device)
+class TestTinymovr_CppGen(unittest.TestCase):
+    """Test C++ code generation from Tinymovr specification."""
 
-        # Each attribute should have an ep_id
-        ep_ids = [attr.ep_id for attr in all_attrs if hasattr(attr, "ep_id") and attr.ep_id >= 0]
+    @classmethod
+    def setUpClass(cls):
+        """Load the Tinymovr specification and generate C++ code once for all tests."""
+        cls.device = _load_device()
+
+        # Separate directory from the C tests so the classes can run on different workers
+        cls._tmp = tempfile.TemporaryDirectory()
+        root = pathlib.Path(cls._tmp.name)
+        cls._cpp_paths = {
+            "output_helpers": str(root / "tinymovr_test_helpers.hpp"),
+            "output_header": str(root / "tinymovr_test.hpp"),
+            "output_impl": str(root / "tinymovr_test.cpp"),
+        }
 
-        # Should have many endpoints (Tinymovr has over 70 endpoints)
-        self.assertGreater(len(ep_ids), 70)
+        generator_cpp.process(cls.device, {"hash_string": "0xTINYMOVR", "paths": cls._cpp_paths})
+        with open(cls._cpp_paths["output_header"]) as f:
+            cls._cpp_header = f.read()
 
-        # All ep_ids should be unique
-        self.assertEqual(len(ep_ids), len(set(ep_ids)))
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the generated files."""
+        cls._tmp.cleanup()
 
-        # ep_ids should start from 0
-        self.assertEqual(min(ep_ids), 0)
+    def test_cpp_generation_succeeds(self):
+        """Test that C++ code generation completes without errors."""
+        # Verify files were created
+        self.assertTrue(os.path.exists(self._cpp_paths["output_helpers"]))
+        self.assertTrue(os.path.exists(self._cpp_paths["output_header"]))
+        self.assertTrue(os.path.exists(self._cpp_paths["output_impl"]))
 
-        # ep_ids should be consecutive
-        self.assertEqual(max(ep_ids), len(ep_ids) - 1)
+    def test_generated_cpp_contains_classes(self):
+        """Test that generated C++ code contains class definitions."""
+        # Should contain class definitions
+        self.assertIn("class", self._cpp_header)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ from avlos.validation import (
     C_RESERVED_WORDS,
     ValidationError,
     validate_all,
+    validate_all_cached,
     validate_c_identifier,
     validate_endpoint_ids,
     validate_function_names,
@@ -255,6 +256,25 @@ class TestValidation(unittest.TestCase):
         # - reserved word setter name (return)
         self.assertTrue(len(errors) >= 4, f"Should collect multiple errors, got {len(errors)}: {errors}")
 
+    def test_validate_all_cached_matches_validate_all(self):
+        """Test that cached validation returns the same errors on repeated calls."""
+        yaml_content = """
+        name: test-device
+        remote_attributes:
+          - name: attr_one
+            summary: Test attribute
+            dtype: uint32
+            getter_name: invalid-getter
+        """
+
+        obj = deserialize(yaml.safe_load(yaml_content))
+        expected = validate_all(obj)
+        self.assertEqual(validate_all_cached(obj), expected)
+
+        # Mutating a returned list must not affect later results
+        validate_all_cached(obj).clear()
+        self.assertEqual(validate_all_cached(obj), expected)
+
 
 if __name__ == "__main__":
     unittest.main()